@@ -2,12 +2,15 @@
 
 import { BoardView } from '@/features/board'
 import { CreateTaskDialog, TaskDrawer } from '@/features/tasks/components'
+import { useStatusSearchParam } from '@/features/tasks/hooks'
 
 export default function BoardPage() {
+  const statusFilter = useStatusSearchParam()
+
   return (
     <>
       <div className="animate-in fade-in duration-300">
-        <BoardView />
+        <BoardView statusFilter={statusFilter} />
       </div>
       <CreateTaskDialog />
       <TaskDrawer />
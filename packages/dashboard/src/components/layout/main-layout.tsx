@@ -1,10 +1,44 @@
 'use client'
 
 import { useEffect } from 'react'
-import { useRouter } from '@tanstack/react-router'
+import { useRouter, useRouterState } from '@tanstack/react-router'
+import { useIsFetching, useQueryClient } from '@tanstack/react-query'
 import { Header } from './header'
 import { useRepoContext } from '@/features/repos/hooks/use-repo-context'
 
+declare global {
+  interface Window {
+    __APP_READY__?: boolean
+  }
+}
+
+// End-to-end tests wait on `window.__APP_READY__`; never set in production builds
+const SIGNAL_APP_READY = import.meta.env.DEV || import.meta.env.MODE === 'test'
+
+/**
+ * Sets `window.__APP_READY__` once the routed page has mounted and its queries settled.
+ * Kept out of MainLayout so `useIsFetching` only re-renders this component.
+ * Re-runs on every location change, so tests can clear the flag before navigating.
+ */
+function AppReadySignal({ repoReady }: { repoReady: boolean }) {
+  const queryClient = useQueryClient()
+  const fetchingCount = useIsFetching()
+  const href = useRouterState({ select: (state) => state.location.href })
+
+  useEffect(() => {
+    if (!repoReady || fetchingCount > 0) return
+    // Defer a tick so queries the new route starts on mount are counted first
+    const timer = setTimeout(() => {
+      if (queryClient.isFetching() === 0) {
+        window.__APP_READY__ = true
+      }
+    }, 0)
+    return () => clearTimeout(timer)
+  }, [repoReady, fetchingCount, href, queryClient])
+
+  return null
+}
+
 interface MainLayoutProps {
   children: React.ReactNode
 }
@@ -22,6 +56,9 @@ export function MainLayout({ children }: MainLayoutProps) {
 
   return (
     <div className="relative min-h-screen bg-gradient-page">
+      {SIGNAL_APP_READY && (
+        <AppReadySignal repoReady={!isLoading && hasRepos && !!selectedRepoId} />
+      )}
       <Header />
       <main
         id="main-content"
@@ -40,6 +40,7 @@ export function ThemeToggle() {
           size="icon"
           className="h-9 w-9"
           aria-label={`Current theme: ${theme}. Click to change theme.`}
+          data-testid="theme-toggle"
         >
           {theme === 'dark' ? (
             <Sun className="h-5 w-5" aria-hidden="true" />
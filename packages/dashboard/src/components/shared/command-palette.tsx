@@ -67,6 +67,7 @@ export function CommandPalette() {
               placeholder="Type a command or search..."
               value={search}
               onValueChange={setSearch}
+              data-testid="command-palette-input"
               className="flex h-12 w-full rounded-md bg-transparent py-3 text-sm outline-none placeholder:text-muted-foreground disabled:cursor-not-allowed disabled:opacity-50"
             />
           </div>
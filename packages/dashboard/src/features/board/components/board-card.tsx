@@ -58,6 +58,7 @@ export function BoardCard({ task, isOverlay }: BoardCardProps) {
       ref={setNodeRef}
       role="button"
       tabIndex={0}
+      data-testid="task-card"
       onClick={handleClick}
       onKeyDown={handleKeyDown}
       {...listeners}
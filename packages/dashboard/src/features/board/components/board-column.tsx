@@ -30,6 +30,7 @@ export function BoardColumn({ config, tasks }: BoardColumnProps) {
   return (
     <div
       ref={setNodeRef}
+      data-testid={`board-column-${id}`}
       className={cn(
         'flex h-full min-w-[280px] max-w-[320px] flex-col rounded-lg border',
         'transition-[box-shadow,background-color] duration-200',
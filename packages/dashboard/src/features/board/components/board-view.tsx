@@ -21,20 +21,26 @@ import { BOARD_COLUMNS } from '../types'
 import { BoardHeader } from './board-header'
 import { BoardColumn, BoardColumnSkeleton } from './board-column'
 import { BoardCard } from './board-card'
-import type { Task } from '@/features/tasks/types'
+import type { Task, TaskStatus } from '@/features/tasks/types'
+
+export interface BoardViewProps {
+  /** Only show tasks in these statuses (all tasks when omitted) */
+  statusFilter?: TaskStatus[]
+}
 
 /**
  * Main Kanban board view component.
  * Displays tasks organized in columns based on their status.
  * Supports drag & drop of draft tasks from "Todo" to "In Progress" to auto-start them.
  */
-export function BoardView() {
+export function BoardView({ statusFilter }: BoardViewProps = {}) {
   const queryClient = useQueryClient()
   const startTask = useStartTask()
   const selectedRepoId = useRepoStore((s) => s.selectedRepoId)
 
   const { columns, isLoading, isError, error } = useBoardTasks({
     repositoryId: selectedRepoId ?? undefined,
+    statuses: statusFilter,
   })
 
   // Drag state: tracks the task currently being dragged for the DragOverlay
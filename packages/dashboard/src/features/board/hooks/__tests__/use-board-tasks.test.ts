@@ -265,6 +265,31 @@ describe('useBoardTasks', () => {
     expect(result.current.columns.todo).toHaveLength(1)
     expect(result.current.columns.inProgress).toHaveLength(1)
   })
+
+  it('filters tasks by statuses when provided', async () => {
+    const tasks = [
+      createMockTask({ status: 'draft' }),
+      createMockTask({ status: 'planning' }),
+      createMockTask({ status: 'coding' }),
+      createMockTask({ status: 'failed' }),
+    ]
+    mockTasksEndpoint(tasks)
+    const { wrapper } = createWrapper()
+
+    const { result } = renderHook(
+      () => useBoardTasks({ statuses: ['planning', 'failed'] }),
+      { wrapper }
+    )
+
+    await waitFor(() => {
+      expect(result.current.isLoading).toBe(false)
+    })
+
+    expect(result.current.totalTasks).toBe(2)
+    expect(result.current.columns.todo).toHaveLength(0)
+    expect(result.current.columns.inProgress[0].status).toBe('planning')
+    expect(result.current.columns.failed[0].status).toBe('failed')
+  })
 })
 
 describe('getColumnConfig', () => {
@@ -2,11 +2,13 @@
 
 import { useMemo } from 'react'
 import { useTasks } from '@/features/tasks/hooks/use-tasks'
-import type { Task } from '@/features/tasks/types'
+import type { Task, TaskStatus } from '@/features/tasks/types'
 import { BOARD_COLUMNS, STATUS_TO_COLUMN, type BoardState, type BoardColumnId } from '../types'
 
 export interface UseBoardTasksOptions {
   repositoryId?: string
+  /** Only include tasks in these statuses */
+  statuses?: TaskStatus[]
 }
 
 export interface UseBoardTasksResult {
@@ -20,10 +22,12 @@ export interface UseBoardTasksResult {
 
 /**
  * Hook that groups tasks by board column based on their status.
- * Supports optional filtering by repository.
+ * Supports optional filtering by repository and status.
  */
 export function useBoardTasks(options: UseBoardTasksOptions = {}): UseBoardTasksResult {
-  const { repositoryId } = options
+  const { repositoryId, statuses } = options
+  // Join to a string so a fresh array with the same statuses doesn't regroup
+  const statusKey = statuses?.join(',')
 
   const { data: tasks, isLoading, isError, error } = useTasks(
     repositoryId ? { repository_id: repositoryId } : {}
@@ -43,10 +47,16 @@ export function useBoardTasks(options: UseBoardTasksOptions = {}): UseBoardTasks
     if (!tasks) return result
 
     // Filter by repository if specified
-    const filteredTasks = repositoryId
+    const byRepo = repositoryId
       ? tasks.filter((task) => task.repository_id === repositoryId)
       : tasks
 
+    // Filter by status if specified
+    const allowed = statusKey ? new Set(statusKey.split(',')) : null
+    const filteredTasks = allowed
+      ? byRepo.filter((task) => allowed.has(task.status))
+      : byRepo
+
     // Group tasks by column
     filteredTasks.forEach((task) => {
       const columnId = STATUS_TO_COLUMN[task.status]
@@ -66,7 +76,7 @@ export function useBoardTasks(options: UseBoardTasksOptions = {}): UseBoardTasks
     })
 
     return result
-  }, [tasks, repositoryId])
+  }, [tasks, repositoryId, statusKey])
 
   const totalTasks = useMemo(() => {
     return (
@@ -0,0 +1,22 @@
+import { describe, it, expect } from 'vitest'
+import { parseStatusSearchParam } from '../use-status-search-param'
+
+describe('parseStatusSearchParam', () => {
+  it('parses a comma-separated list of statuses', () => {
+    expect(parseStatusSearchParam('planning,failed')).toEqual(['planning', 'failed'])
+  })
+
+  it('accepts an array of statuses', () => {
+    expect(parseStatusSearchParam(['backlog'])).toEqual(['backlog'])
+  })
+
+  it('drops unknown statuses', () => {
+    expect(parseStatusSearchParam('planning,bogus')).toEqual(['planning'])
+  })
+
+  it('returns undefined when nothing valid is given', () => {
+    expect(parseStatusSearchParam(undefined)).toBeUndefined()
+    expect(parseStatusSearchParam('bogus')).toBeUndefined()
+    expect(parseStatusSearchParam(42)).toBeUndefined()
+  })
+})
@@ -11,3 +11,4 @@ export { useTaskChat, type ChatEntry } from "./use-task-chat";
 export { useStartTask } from "./use-start-task";
 export { useOpenEditor } from "./use-open-editor";
 export { useResolveConflicts } from "./use-resolve-conflicts";
+export { useStatusSearchParam, parseStatusSearchParam } from "./use-status-search-param";
@@ -0,0 +1,25 @@
+'use client'
+
+import { useSearch } from '@tanstack/react-router'
+import { TASK_STATUSES, type TaskStatus } from '../types'
+
+/**
+ * Parses a `status` search param (`?status=planning,failed`) into known task
+ * statuses. Unknown values are dropped; returns undefined when none remain.
+ */
+export function parseStatusSearchParam(value: unknown): TaskStatus[] | undefined {
+  const raw = Array.isArray(value) ? value : typeof value === 'string' ? value.split(',') : []
+  const statuses = raw
+    .map((s) => (typeof s === 'string' ? s.trim() : s))
+    .filter((s): s is TaskStatus => (TASK_STATUSES as readonly unknown[]).includes(s))
+  return statuses.length > 0 ? statuses : undefined
+}
+
+/**
+ * Hook returning the statuses from the `?status=` search param, so a filtered
+ * board can be opened directly from a URL.
+ */
+export function useStatusSearchParam(): TaskStatus[] | undefined {
+  const { status } = useSearch({ strict: false }) as { status?: TaskStatus[] }
+  return status
+}
@@ -2,6 +2,8 @@ import { createRouter, createRoute, createRootRoute, Outlet, redirect } from '@t
 import { Providers } from '@/components/shared/providers'
 import { MainLayout } from '@/components/layout/main-layout'
 import { getAuthToken } from '@/lib/auth'
+import { parseStatusSearchParam } from '@/features/tasks/hooks/use-status-search-param'
+import type { TaskStatus } from '@/features/tasks/types'
 
 // Lazy imports for pages to enable code splitting
 import HomePage from '@/app/page'
@@ -61,10 +63,17 @@ const indexRoute = createRoute({
   component: HomePage,
 })
 
-// Board route
+// Board route - `?status=planning,failed` limits the board to those statuses
+interface BoardSearch {
+  status?: TaskStatus[]
+}
+
 const boardRoute = createRoute({
   getParentRoute: () => mainLayoutRoute,
   path: '/board',
+  validateSearch: (search: Record<string, unknown>): BoardSearch => ({
+    status: parseStatusSearchParam(search.status),
+  }),
   component: BoardPage,
 })
 
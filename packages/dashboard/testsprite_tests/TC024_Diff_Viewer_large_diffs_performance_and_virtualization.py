@@ -1,185 +1,96 @@
 import asyncio
-from playwright import async_api
+import pytest
+from playwright.async_api import expect
+from _harness import (
+    API_URL,
+    BASE_URL,
+    create_task,
+    navigate,
+    new_context,
+    open_board,
+    run_standalone,
+    scratch_repo,
+    setup_page,
+)
 
-async def run_test():
-    pw = None
-    browser = None
+LARGE_DIFF_FILES = 250
+
+def large_diff_payload(file_count):
+    """Build a /changes response touching `file_count` files, shaped like TaskChangesResponse."""
+    files = [
+        {
+            "path": f"src/generated/module_{i:03d}.ts",
+            "status": "modified",
+            "additions": 3,
+            "deletions": 1,
+            "oldContent": f"export const value{i} = {i}\n",
+            "newContent": f"// updated\nexport const value{i} = {i + 1}\nexport const label{i} = 'm{i}'\n",
+        }
+        for i in range(file_count)
+    ]
+    diff = "".join(
+        f"diff --git a/{f['path']} b/{f['path']}\n--- a/{f['path']}\n+++ b/{f['path']}\n"
+        for f in files
+    )
+    return {
+        "files": files,
+        "diff": diff,
+        "summary": {
+            "totalAdditions": 3 * file_count,
+            "totalDeletions": file_count,
+            "filesChanged": file_count,
+        },
+    }
+
+
+async def seed_large_diff_task(page, context, repo):
+    """Create a task through the API and serve a large diff for its /changes endpoint.
+
+    Changes are computed server-side from the task's git worktree, so the
+    diff itself is fulfilled at the network layer rather than persisted.
+    """
+    task_id = (await create_task(page, repo, "Large diff viewer test task"))["id"]
+
+    payload = large_diff_payload(LARGE_DIFF_FILES)
+    await context.route(
+        f"{API_URL}/tasks/{task_id}/changes",
+        lambda route: route.fulfill(json=payload),
+    )
+    return task_id
+
+
+async def run_test(browser):
     context = None
 
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
-        page = await context.new_page()
-
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3003/tasks", wait_until="commit", timeout=10000)
-
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3003/tasks
-        await page.goto("http://localhost:3003/tasks", wait_until="commit", timeout=10000)
-        
-        # -> Open the task 'Add timestamp endpoint' from the tasks list to view its details and navigate to the Changes tab.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div[2]/div/div/div[2]/a[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Attempt to open the tab area to reveal tab buttons. Click the Logs tab (index 742) to change the active tab and then locate/click the Changes tab if it becomes available.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div/div[2]/div[1]/div/div[1]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the Overview tab (index 741) to change active tab and then re-check the tablist for a clickable Changes tab/button.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div/div[2]/div[1]/div/div[1]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click 'Back to Tasks' (index 723) to return to the tasks list so the task can be reopened and the Changes tab can be accessed.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div/div[1]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Attempt to interact with the tablist container to reveal/click the 'Changes' tab by clicking the tablist element (index 804).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/main/div/div/div/div[2]/div[1]/div/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the task 'Add timestamp endpoint' from the main content task list (click element index 1126) to load its details so the Changes tab can be accessed.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div[2]/div/div/div[2]/a[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the task 'Add timestamp endpoint' (index 1126) to open its details so the Changes tab can be accessed. If task details load, locate the Changes tab.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/main/div/div/div[2]/div/div/div[2]/a[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Try to reveal the main content by clicking the 'Skip to main content' link so the SPA can render and the tab controls (including Changes) become interactable.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the tablist container (index 2080) to focus/show tab controls, then click the Logs tab (index 2018) to change active tab and attempt to reveal a clickable 'Changes' control.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div/div[2]/div[1]/div/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div/div[2]/div[1]/div/div[1]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Return to the tasks list (click 'Back to Tasks' index 1999), then reopen 'Add timestamp endpoint' from the list using list item index 1950 so the Changes tab can be accessed.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div/div[1]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[2]/div/div/div/div/div[2]/a[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the Changes view for the current task by navigating directly to the task's changes URL (last-resort navigation since the Changes tab button is not exposed as an interactive element).
-        await page.goto("http://localhost:3003/tasks/b15318d5-0dc6-4bf5-88c1-25735c673b74/changes", wait_until="commit", timeout=10000)
-        
-        # -> Click 'Go to Tasks' (link index 2477) to return to the tasks list so the task can be reopened via the UI, then attempt to access the Changes view through available task links.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/div[2]/a[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Go to Tasks' link (index 2477) to return to the tasks list so the task can be reopened via the UI.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div/div[2]/a[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Reload the /tasks page to recover the SPA and expose interactive elements. After reload, locate and open the target task and then open the Changes tab.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        await page.goto("http://localhost:3003/tasks", wait_until="commit", timeout=10000)
-        
-        # -> Open the task 'Add timestamp endpoint' from the tasks list (click the task item) so the task details load and the Changes tab can be located.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[2]/div/div/div/div/div[2]/a[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the task details by clicking the 'Add timestamp endpoint' list item (index 4493). After the task details load, locate the tab controls and attempt to open the 'Changes' tab.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/main/div/div/div[2]/div/div/div[2]/a[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Navigate to the Tasks list (/tasks) to restore the SPA rendering, then locate and open a candidate task that likely contains 200+ file changes and open its Changes view.
-        await page.goto("http://localhost:3003/tasks", wait_until="commit", timeout=10000)
-        
-        # -> Click the 'Add timestamp endpoint' task list item (index 6186) to open its details so the Changes tab can be located and opened.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div[2]/div/div/div[2]/a[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the 'Add status endpoint' task (index 6190) from the tasks list to load its details so the Changes tab can be located and opened.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/main/div/div/div[2]/div/div/div[2]/a[10]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Navigate to the Tasks list page (/tasks) to restore SPA rendering so a candidate task with many file changes can be opened and its Changes view accessed.
-        await page.goto("http://localhost:3003/tasks", wait_until="commit", timeout=10000)
-        
-        await asyncio.sleep(5)
+        # Create a new browser context, reusing the saved dashboard state when save_storage_state.py has been run
+        context = await new_context(browser)
+
+        # Start on the repo picker: the main layout needs a selected repository
+        page = await setup_page(context, f"{BASE_URL}/repos")
+
+        # Seed into a throwaway repo: deleting a task reverts uncommitted work in its repository
+        async with scratch_repo(page) as repo:
+            # Seed a task with 250 changed files instead of hunting for one in the UI
+            task_id = await seed_large_diff_task(page, context, repo)
+
+            # Select the repo, then move to the task's Changes view without reloading away the selection
+            await open_board(page, repo)
+            await navigate(page, f"/diff/{task_id}")
+
+            # -> The diff viewer should render the file list for the large change set.
+            await expect(page.get_by_text(f"{LARGE_DIFF_FILES} files changed")).to_be_visible(timeout=5000)
+            await expect(page.get_by_title("src/generated/module_000.ts").first).to_be_visible(timeout=5000)
 
     finally:
         if context:
             await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
 
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tc024(browser):
+    await run_test(browser)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
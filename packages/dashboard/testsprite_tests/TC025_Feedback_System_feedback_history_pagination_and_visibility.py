@@ -1,189 +1,98 @@
 import asyncio
-from playwright import async_api
+import json
+import re
+import uuid
+import pytest
+from playwright.async_api import expect
+from _harness import (
+    API_URL,
+    BASE_URL,
+    create_task,
+    new_context,
+    open_board,
+    run_standalone,
+    scratch_repo,
+    setup_page,
+)
 
-async def run_test():
-    pw = None
-    browser = None
+CHAT_ENTRIES = 50
+
+
+def chat_history_stream(count):
+    """SSE body replaying `count` chat messages, then the terminal `complete` event.
+
+    The feedback endpoint rejects finished tasks and resumes the agent on live
+    ones, so the history is served on the task's /logs stream instead of being
+    POSTed one message at a time.
+    """
+    events = [
+        "event: chat_message\ndata: "
+        + json.dumps({
+            "id": f"history-{i}",
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": f"History entry {i + 1}",
+            "timestamp": f"2025-01-01T00:{i // 60:02d}:{i % 60:02d}Z",
+        })
+        + "\n\n"
+        for i in range(count)
+    ]
+    events.append('event: complete\ndata: {"pr_url": null}\n\n')
+    return "".join(events)
+
+
+async def run_test(browser):
     context = None
 
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
-        page = await context.new_page()
-
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3003/tasks", wait_until="commit", timeout=10000)
-
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3003/tasks
-        await page.goto("http://localhost:3003/tasks", wait_until="commit", timeout=10000)
-        
-        # -> Open the New Task dialog to create a test task to receive 50+ feedback entries.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/header/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Fill the Create New Task form with a test task titled 'Feedback history test task' and submit it so feedback entries can be added.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=html/body/div[5]/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Feedback history test task')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=html/body/div[5]/form/div[2]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Create a task to test feedback history UI. This task will be used to populate 50+ feedback entries and verify pagination/lazy-loading and that feedback items link back to timestamped log locations.')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=html/body/div[5]/form/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('https://github.com/test/repo')
-        
-        # -> Click the 'Create Task' button to submit the new task so feedback entries can be populated (button index 656).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[4]/form/div[7]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Close the New Task dialog (if creation finished) and locate the newly created task in the task list to open its details.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the Logs tab for this task to view feedback history (click the 'Logs' tab). After logs load, populate feedback history with 50+ entries and then exercise scrolling to trigger pagination/infinite-loading.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div/div[2]/div[1]/div/div[1]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the backend API (http://localhost:3000) in a new tab to discover endpoints for creating feedback entries for task 5f89194b-860a-40c9-b772-280c2a57df52 so the feedback history can be populated.
-        await page.goto("http://localhost:3000/", wait_until="commit", timeout=10000)
-        
-        # -> Probe common backend endpoints to find the correct API path for creating feedback for task 5f89194b-860a-40c9-b772-280c2a57df52. Once found, prepare to POST 50+ feedback entries for that task.
-        await page.goto("http://localhost:3000/api/tasks/5f89194b-860a-40c9-b772-280c2a57df52/feedback", wait_until="commit", timeout=10000)
-        
-        await page.goto("http://localhost:3000/tasks/5f89194b-860a-40c9-b772-280c2a57df52/feedback", wait_until="commit", timeout=10000)
-        
-        await page.goto("http://localhost:3000/api/tasks/5f89194b-860a-40c9-b772-280c2a57df52", wait_until="commit", timeout=10000)
-        
-        # -> Request task list endpoint to discover available task-related API routes (navigate to http://localhost:3000/api/tasks). If that returns a schema or list, locate the correct endpoint to POST feedback entries for task id 5f89194b-860a-40c9-b772-280c2a57df52.
-        await page.goto("http://localhost:3000/api/tasks", wait_until="commit", timeout=10000)
-        
-        # -> Probe additional likely API endpoints to discover the feedback creation endpoint; start by requesting http://localhost:3000/api/v1/tasks.
-        await page.goto("http://localhost:3000/api/v1/tasks", wait_until="commit", timeout=10000)
-        
-        await page.goto("http://localhost:3000/api/v1/tasks/5f89194b-860a-40c9-b772-280c2a57df52/feedback", wait_until="commit", timeout=10000)
-        
-        await page.goto("http://localhost:3000/api/feedbacks", wait_until="commit", timeout=10000)
-        
-        # -> Probe the next likely endpoint /api/v1/feedbacks to check for feedback creation/listing API.
-        await page.goto("http://localhost:3000/api/v1/feedbacks", wait_until="commit", timeout=10000)
-        
-        # -> Probe the API documentation endpoints to discover the correct feedback creation endpoint (try /openapi.json, /swagger.json, /swagger, /api/docs, then try dashboard API root at port 3003).
-        await page.goto("http://localhost:3000/openapi.json", wait_until="commit", timeout=10000)
-        
-        await page.goto("http://localhost:3000/swagger.json", wait_until="commit", timeout=10000)
-        
-        await page.goto("http://localhost:3000/swagger", wait_until="commit", timeout=10000)
-        
-        # -> Probe additional API documentation paths on the backend to discover the feedback creation endpoint (start with /docs). If docs are not present, continue probing likely endpoints (/swagger-ui, /api/docs, /apidocs) and check port 3003 API surface if needed.
-        await page.goto("http://localhost:3000/docs", wait_until="commit", timeout=10000)
-        
-        # -> Return to the Dashboard tasks page (http://localhost:3003/tasks), open the test task details for task id 5f89194b-860a-40c9-b772-280c2a57df52, and locate the feedback/history UI (or Logs tab) to continue with feedback population or find UI controls or API hints.
-        await page.goto("http://localhost:3003/tasks", wait_until="commit", timeout=10000)
-        
-        # -> Open the test task details by clicking the 'Feedback history test task' entry in the tasks sidebar so its Logs/Feedback UI can be inspected and interacted with.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div[2]/div/div/div[2]/a[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the 'Feedback history test task' details to locate the Feedback/Logs UI and confirm whether there is a UI control to add feedback or an API hint. If details open, locate the feedback history panel (or Logs tab) so population approach can be determined.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/main/div/div/div[2]/div/div/div[2]/a[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Attempt to make the SPA/task details render by interacting with the page (click 'Skip to main content'). If that does not load the UI, then reload or navigate back to /tasks and reopen the task to access Logs/Feedback UI.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the Logs tab on the task details page to view the feedback/history UI and locate controls or endpoints for adding feedback (click element index 2959).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div/div[2]/div[1]/div/div[1]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Probe the dashboard API to discover the feedback creation endpoint for task id 5f89194b-860a-40c9-b772-280c2a57df52 by requesting http://localhost:3003/api/tasks (start API discovery on port 3003).
-        await page.goto("http://localhost:3003/api/tasks", wait_until="commit", timeout=10000)
-        
-        # -> Return to the dashboard Tasks page by clicking 'Go to Tasks', then open the 'Feedback history test task' details and its Logs/Feedback panel to continue (populate feedback via discovered API or UI).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/div[2]/a[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Return to the dashboard Tasks UI (open the Tasks list) so the test task can be opened and its Logs/Feedback UI accessed. Start by clicking the 'Go to Tasks' link on the current 404 page.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div/div[2]/a[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Render the dashboard SPA main content so the task details and Logs/Feedback UI are accessible by clicking 'Skip to main content'.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the 'Feedback history test task' details so the Logs/Feedback UI is visible (immediate action: click the task entry in the task list).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div[2]/div/div/div[2]/a[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        await asyncio.sleep(5)
+        # Create a new browser context, reusing the saved dashboard state when save_storage_state.py has been run
+        context = await new_context(browser)
+
+        # Start on the repo picker: the board needs a selected repository
+        page = await setup_page(context, f"{BASE_URL}/repos")
+
+        # Seed into a throwaway repo: deleting a task reverts uncommitted work in its repository
+        async with scratch_repo(page) as repo:
+            # Seed a finished task, so the drawer shows its chat read-only and nothing resumes the agent
+            title = f"Chat history {uuid.uuid4().hex[:8]}"
+            task_id = (await create_task(page, repo, title, status="done"))["id"]
+
+            # Serve its chat history on the /logs SSE stream the drawer subscribes to
+            history = chat_history_stream(CHAT_ENTRIES)
+            await context.route(
+                f"{API_URL}/tasks/{task_id}/logs*",
+                lambda route: route.fulfill(
+                    status=200,
+                    headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"},
+                    body=history,
+                ),
+            )
+
+            # -> Open the seeded task from its board card, matched by its exact title
+            await open_board(page, repo)
+            card = page.get_by_test_id("task-card").filter(
+                has=page.get_by_role("heading", name=title, exact=True)
+            )
+            await card.click()
+
+            # --> Assertions to verify final state
+            drawer = page.get_by_role("dialog", name=title)
+            entries = drawer.get_by_text(re.compile(r"^History entry \d+$"))
+            await expect(entries, f"Expected all {CHAT_ENTRIES} history entries in the drawer").to_have_count(
+                CHAT_ENTRIES, timeout=5000
+            )
+            # The oldest entry stays rendered while the chat auto-scrolls to the newest one
+            await expect(drawer.get_by_text("History entry 1", exact=True)).to_be_attached()
+            await expect(drawer.get_by_text(f"History entry {CHAT_ENTRIES}", exact=True)).to_be_in_viewport()
 
     finally:
         if context:
             await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
 
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tc025(browser):
+    await run_test(browser)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
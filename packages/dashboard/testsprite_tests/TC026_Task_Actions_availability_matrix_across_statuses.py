@@ -1,215 +1,86 @@
 import asyncio
-from playwright import async_api
+import uuid
+import pytest
+from playwright.async_api import expect
+from _harness import (
+    BASE_URL,
+    create_task,
+    navigate,
+    new_context,
+    open_board,
+    run_standalone,
+    scratch_repo,
+    setup_page,
+)
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
+# Actions the task drawer should offer per status; every other action must be absent
+EXPECTED_ACTIONS = {
+    "failed": ("Retry", "Delete Task"),
+    "backlog": ("Execute",),
+    "planning": ("Cancel",),
+    "in_progress": ("Cancel",),
+    "awaiting_review": ("Create PR", "Delete Task"),
+    "approved": (),
+    "done": (),
+}
+ACTION_BUTTONS = ("Start", "Edit Task", "Execute", "Cancel", "Retry", "Create PR", "Delete Task")
+
+
+async def check_status(browser, status):
+    """Seed a task in `status`, open it from the filtered board and check its action buttons.
+
+    Legacy statuses like backlog or planning rarely have rows of their own,
+    so each check creates its task through the API rather than relying on one.
+    """
+    context = await new_context(browser)
 
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
-        page = await context.new_page()
-
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3003/tasks", wait_until="commit", timeout=10000)
-
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3003/tasks
-        await page.goto("http://localhost:3003/tasks", wait_until="commit", timeout=10000)
-        
-        # -> Click the 'Failed' status filter to list failed tasks, then open a failed task detail.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div[1]/div[2]/div/div[2]/div[2]/span[9]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the first failed task detail ('Add timestamp endpoint') to inspect contextual actions (click element index 630).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div[2]/div/div/div[2]/a[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the Backlog status filter to show backlog tasks, then open the first backlog task detail to inspect contextual actions.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/main/div/div/div[1]/div[2]/div/div[2]/div[2]/span[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the first backlog task detail by clicking the first task in the list (element index 592).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[2]/div/div/div/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the backlog task detail by clicking the 'Test task' entry (index 592) so the detail pane updates, then inspect the contextual action buttons for that status.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div/aside/div[2]/div[2]/div/div/div/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Apply the Backlog filter again to ensure backlog view is active, then open the first backlog task detail (click a task entry likely in the backlog list) to inspect contextual actions.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[1]/div/div[2]/span[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[2]/div/div/div/div/div[2]/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Recover the tasks page (reload /tasks) so the SPA loads. After reload, open the backlog status and then open the first backlog task detail to inspect contextual action buttons. Continue with the remaining statuses afterwards.
-        await page.goto("http://localhost:3003/tasks", wait_until="commit", timeout=10000)
-        
-        # -> Open a backlog task detail (use a backlog task entry that hasn't been clicked repeatedly) to inspect the contextual action buttons (Execute, Cancel, Extend, Approve, Retry, View PR). Click element index 2765 (Implement user authentication - Backlog).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div[2]/div/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Ensure the Backlog view is active by clicking the Backlog status filter, then open a backlog task detail (if view updates) to inspect contextual action buttons for Backlog status.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div/aside/div[2]/div[1]/div/div[2]/span[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Return to the Tasks list (click 'Back to Tasks') so the other status filters can be selected and the first task for each remaining status (planning, in_progress, awaiting_review, approved, done) can be opened and their contextual action buttons inspected.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div/div[1]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the Planning status filter and then open the first Planning task detail to inspect contextual action buttons (Execute, Cancel, Extend, Approve, Retry, View PR).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div/aside/div[2]/div[1]/div/div[2]/span[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div/aside/div[2]/div[2]/div/div/div/div/div[2]/a[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the visible 'Skip to main content' link (index 3742) to try to reveal the SPA content. If that does not load the SPA, reload /tasks and then continue opening the Planning task detail to inspect contextual action buttons.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the Planning status filter to view Planning tasks, then open the first Planning task detail to inspect contextual action buttons (Execute, Cancel, Extend, Approve, Retry, View PR).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[1]/div/div[2]/span[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Activate the Planning filter and open the first Planning task detail so contextual action buttons can be inspected (Execute/Cancel/Extend/Approve/Retry/View PR). Immediate action: click the Planning status filter.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[1]/div/div[2]/span[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Activate the Planning filter so Planning tasks are shown, then open the first Planning task detail to inspect contextual action buttons.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[1]/div/div[2]/span[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Clear active filters to reveal tasks, then activate the Planning filter so Planning tasks are shown (then open the first Planning task to inspect contextual action buttons). Immediate actions: Clear filters -> click Planning.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[1]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[1]/div/div[2]/span[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the Planning status filter to show Planning tasks so a Planning task detail can be opened and contextual actions inspected.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[1]/div/div[2]/span[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Activate the Planning filter so Planning tasks are shown (immediate action: click the Planning status filter), then open the first Planning task detail to inspect contextual action buttons (Execute, Cancel, Extend, Approve, Retry, View PR).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[1]/div/div[2]/span[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Clear active filters, activate the Planning filter, then open the first Planning task detail to inspect contextual action buttons (Execute, Cancel, Extend, Approve, Retry, View PR).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[1]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[1]/div/div[2]/span[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Clear active filters to ensure tasks are visible, then activate the Planning filter to show Planning tasks.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[1]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[1]/div/div[2]/span[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Clear active filters (if any) and activate the Planning filter, then open the first Planning task detail to inspect contextual action buttons.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[1]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[1]/div/div[2]/span[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        await asyncio.sleep(5)
+        page = await setup_page(context, f"{BASE_URL}/repos")
+
+        # Seed into a throwaway repo: deleting a task reverts uncommitted work in its repository
+        async with scratch_repo(page) as repo:
+            title = f"Actions {status} {uuid.uuid4().hex[:8]}"
+            await create_task(page, repo, title, status=status)
+
+            # -> Open the seeded task from the board filtered down to this status.
+            await open_board(page, repo)
+            await navigate(page, f"/board?status={status}")
+            card = page.get_by_test_id("task-card").filter(
+                has=page.get_by_role("heading", name=title, exact=True)
+            )
+            await card.click()
+
+            # --> Assertions to verify final state
+            # The dialog only takes the task's title once the task has loaded
+            drawer = page.get_by_role("dialog", name=title)
+            await expect(drawer).to_be_visible()
+
+            expected = EXPECTED_ACTIONS[status]
+            for label in expected:
+                button = drawer.get_by_role("button", name=label, exact=True)
+                await expect(button, f"{status}: expected a {label!r} action").to_be_visible()
+            for label in set(ACTION_BUTTONS) - set(expected):
+                button = drawer.get_by_role("button", name=label, exact=True)
+                await expect(button, f"{status}: unexpected {label!r} action").to_have_count(0)
+            # No PR was ever opened, so View PR (rendered as a link) never shows
+            await expect(drawer.get_by_role("link", name="View PR")).to_have_count(0)
+
+            if status == "approved":
+                await expect(drawer.get_by_text("Dev Agent is starting...")).to_be_visible()
 
     finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await context.close()
+
+
+async def run_test(browser):
+    # The statuses are independent, so walk them side by side in separate contexts
+    await asyncio.gather(*[check_status(browser, status) for status in EXPECTED_ACTIONS])
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tc026(browser):
+    await run_test(browser)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
@@ -1,138 +1,107 @@
 import asyncio
-from playwright import async_api
+import uuid
+import pytest
+from playwright.async_api import expect
+from _harness import (
+    BASE_URL,
+    auth_headers,
+    create_task,
+    fill,
+    new_context,
+    open_board,
+    run_standalone,
+    scratch_repo,
+    setup_page,
+)
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
+# Failed task the flow seeds and retries, and the task it creates to check cache invalidation;
+# the suffix keeps runs (and leftovers from aborted ones) from matching each other
+FAILED_TASK_TITLE = f"E2E retry task - cache test {uuid.uuid4().hex[:8]}"
+NEW_TASK_TITLE = f"E2E create task - cache test {uuid.uuid4().hex[:8]}"
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
 
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
-        page = await context.new_page()
+async def run_test(browser):
+    context = None
 
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3003/tasks", wait_until="commit", timeout=10000)
+    try:
+        # Create a new browser context, starting from the saved storage state when present
+        context = await new_context(browser)
 
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
+        # Navigate to the repo picker, then open the board of a throwaway repo: deleting
+        # a task reverts uncommitted work in its repository, so never use a real one
+        page = await setup_page(context, f"{BASE_URL}/repos")
+        async with scratch_repo(page) as repo:
+            # Seed a failed task to retry instead of relying on one already being in the DB
+            await create_task(page, repo, FAILED_TASK_TITLE, status="failed")
+            await open_board(page, repo)
 
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+            # Locator reused across steps, built once: the seeded card while it sits in the Failed column
+            failed_card = page.get_by_test_id("board-column-failed").get_by_test_id("task-card").filter(
+                has=page.get_by_role("heading", name=FAILED_TASK_TITLE, exact=True)
+            )
 
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3003/tasks
-        await page.goto("http://localhost:3003/tasks", wait_until="commit", timeout=10000)
-        
-        # -> Open a task detail by clicking the 'Test task' entry in the tasks list (element index 23).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div[2]/div/div/div[2]/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Test task' entry (index 23) to open the task detail panel so mutation buttons (Approve / Retry / Cancel) become visible.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/main/div/div/div[2]/div/div/div[2]/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Click the 'Retry' button (index 1501) to perform the retry mutation, then verify the tasks list/sidebar updates (TanStack Query cache invalidation or update) to reflect the new state.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div/div[2]/div[2]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Wait for the retry mutation to complete, then open the Tasks list view to verify TanStack Query cache updates (left sidebar list reflects updated state).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div/div[1]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+            # Interact with the page elements to simulate user flow
+            # -> Open the failed card so its drawer exposes the Retry mutation.
+            await failed_card.click()
+            
+            # -> Click the 'Retry' button to perform the retry mutation.
+            # Click element
+            drawer = page.get_by_role("dialog", name=FAILED_TASK_TITLE)
+            await drawer.get_by_role("button", name="Retry", exact=True).click()
+            
+            # -> Close the drawer; the retried task must leave the Failed column without a manual refresh,
+            # which only happens if the mutation invalidated the board's task query.
+            await page.keyboard.press("Escape")
+            await expect(
+                failed_card,
+                "The retried task stayed in the Failed column, so the tasks query was not invalidated",
+            ).to_have_count(0, timeout=10000)
+            
+            # -> Open the create task form by clicking the 'New Task' button so the create-task mutation can be performed and the tasks list cache behaviour verified.
+            # Click element
+            elem = page.get_by_role("button", name="New Task").first
+            await elem.click()
         
-        # -> Click 'Back to Tasks' (index 1409) to open the tasks list view and verify the left sidebar list reflects the task state change after the retry mutation.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/main/div/div/div/div[1]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+            # -> Describe the new task in the New Task dialog's single textarea; the server derives the title from it.
+            await fill(page.get_by_label("What do you need?"), NEW_TASK_TITLE)
         
-        # -> Open a task detail that can be acted on (click the 'Test task' entry in the left sidebar) so mutation buttons (Approve/Cancel) become visible and can be used to perform and verify cache updates.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div/aside/div[2]/div[2]/div/div/div/div/div[2]/a[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+            # -> Click 'Create Task' (index=3201) to submit the create-task mutation, wait for completion, then extract page content to confirm the new task 'E2E create task - cache test' appears in the tasks list or page.
+            # Click element
+            elem = page.get_by_role("button", name="Create Task", exact=True)
+            # Hold on to the create request so the task is known to be persisted before teardown
+            async with page.expect_response(
+                lambda r: r.url == f"{BASE_URL}/api/tasks" and r.request.method == "POST",
+                timeout=10000,
+            ):
+                await elem.click()
         
-        # -> Open the task detail from the main tasks list so mutation buttons (Approve / Cancel) become visible and then perform the Approve mutation. First step: click the task card in the main list to open its detail view.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[3]/div/main/div/div/div[2]/div/div/div[2]/a[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Open the create task form by clicking the 'New Task' button so the create-task mutation can be performed and the tasks list cache behaviour verified.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[2]/header/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # -> Fill the Create New Task form and submit it (click 'Create Task' button index=3201) to trigger the create-task mutation so the tasks list cache can be verified.
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=html/body/div[5]/form/div[1]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('E2E create task - cache test')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=html/body/div[5]/form/div[2]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('End-to-end test task to validate TanStack Query cache invalidation/update after create mutation. Verify the new task appears in the tasks list without manual refresh.')
-        
-        frame = context.pages[-1]
-        # Input text
-        elem = frame.locator('xpath=html/body/div[5]/form/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('https://github.com/test/e2e-repo')
-        
-        # -> Click 'Create Task' (index=3201) to submit the create-task mutation, wait for completion, then extract page content to confirm the new task 'E2E create task - cache test' appears in the tasks list or page.
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[4]/form/div[7]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=E2E create task - cache test').first).to_be_visible(timeout=3000)
-        except AssertionError:
-            raise AssertionError("Test case failed: The test attempted to verify that after creating a task the tasks list (TanStack Query cache) was invalidated/updated so the new task 'E2E create task - cache test' appears in the UI without a manual refresh, but the expected item was not found — indicating the cache update or UI refresh did not occur.")
-        await asyncio.sleep(5)
+            # --> Assertions to verify final state
+            # The task itself was persisted: check the API directly instead of through the UI
+            response = await page.request.get(f"{BASE_URL}/api/tasks", headers=await auth_headers(page))
+            assert response.ok, f"Listing tasks failed with HTTP {response.status}"
+            assert any(task["title"] == NEW_TASK_TITLE for task in await response.json()), (
+                f"'{NEW_TASK_TITLE}' was not returned by GET /api/tasks after the create mutation"
+            )
+
+            # The board picked it up without a manual refresh, i.e. the TanStack Query cache was invalidated.
+            # A new task is a draft, so it has to land in the Todo column specifically.
+            created_task = page.get_by_test_id("board-column-todo").get_by_test_id("task-card").filter(
+                has=page.get_by_role("heading", name=NEW_TASK_TITLE, exact=True)
+            )
+            await expect(
+                created_task,
+                "Test case failed: The test attempted to verify that after creating a task the board (TanStack Query cache) was invalidated/updated so the new draft appears in the Todo column without a manual refresh, but the expected card was not found — indicating the cache update or UI refresh did not occur.",
+            ).to_be_visible(timeout=10000)
 
     finally:
         if context:
             await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
 
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tc028(browser):
+    await run_test(browser)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
@@ -0,0 +1,199 @@
+import shutil
+import subprocess
+import tempfile
+from contextlib import asynccontextmanager
+from pathlib import Path
+from playwright.async_api import Browser, BrowserContext, Error, Page, async_playwright, expect
+
+BASE_URL = "http://localhost:3003"
+API_URL = f"{BASE_URL}/api"
+
+# Cookies + localStorage captured by save_storage_state.py; contexts start from it when present
+STATE_PATH = Path(__file__).with_name("state.json")
+
+# Key under which the dashboard keeps its auth token in sessionStorage
+AUTH_TOKEN_KEY = "agent-board-auth-token"
+
+# Chromium launch flags shared by the conftest fixture and the standalone runners
+CHROMIUM_ARGS: tuple[str, ...] = (
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+)
+
+# Short action timeout; assertions retry a little longer through expect()
+DEFAULT_TIMEOUT_MS = 1500
+expect.set_options(timeout=3000)
+
+# Third-party resource types no assertion looks at; aborting them keeps navigations light.
+# The dashboard's own assets are always served so its layout matches what users see.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+
+async def new_context(browser: Browser) -> BrowserContext:
+    """Open a context preloaded with the saved storage state, when one has been captured."""
+    return await browser.new_context(storage_state=str(STATE_PATH) if STATE_PATH.exists() else None)
+
+
+async def block_static_assets(route):
+    """Route handler aborting third-party BLOCKED_RESOURCE_TYPES; install with context.route("**/*", ...)."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES and not request.url.startswith(BASE_URL):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def auth_headers(page: Page) -> dict[str, str]:
+    """Bearer header for page.request, from the token the dashboard keeps in sessionStorage."""
+    token = await page.evaluate(
+        "(key) => { try { return sessionStorage.getItem(key) } catch { return null } }",
+        AUTH_TOKEN_KEY,
+    )
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+@asynccontextmanager
+async def scratch_repo(page: Page):
+    """Register a throwaway git repository to seed tasks into, and remove it afterwards.
+
+    Never seed into a developer's repository: DELETE /api/tasks/{id} runs
+    `git checkout -- .` and `git clean -fd` in the task's repo when it has no
+    worktree, which is always the case for seeded tasks. Tasks left in the
+    scratch repo are deleted with it, so tests need no cleanup of their own.
+    """
+    path = Path(tempfile.mkdtemp(prefix="dash-agent-e2e-"))
+    git = ["git", "-c", "user.name=e2e", "-c", "user.email=e2e@localhost", "-C", str(path)]
+    subprocess.run([*git, "init", "-q", "-b", "main"], check=True)
+    subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", "Initial commit"], check=True)
+
+    headers = await auth_headers(page)
+    response = await page.request.post(
+        f"{API_URL}/repos/local/add", headers=headers, data={"name": path.name, "path": str(path)}
+    )
+    assert response.ok, f"Registering the scratch repo failed with HTTP {response.status}"
+    repo = await response.json()
+
+    try:
+        yield repo
+    finally:
+        # Best effort: raising here would hide the test's own failure
+        try:
+            response = await page.request.get(
+                f"{API_URL}/tasks", headers=headers, params={"repository_id": repo["id"]}
+            )
+            for task in await response.json() if response.ok else []:
+                await page.request.delete(f"{API_URL}/tasks/{task['id']}", headers=headers)
+            await page.request.delete(f"{API_URL}/repos/{repo['id']}", headers=headers)
+        except Error:
+            pass
+        shutil.rmtree(path, ignore_errors=True)
+
+
+async def create_task(page: Page, repo: dict, user_input: str, status: str | None = None) -> dict:
+    """Create a task on repo through the API and return it.
+
+    user_input doubles as the title, so keep it under 50 characters to stop the
+    server from truncating it. When status is given the task is PATCHed straight
+    into it instead of driving the agent there.
+    """
+    headers = await auth_headers(page)
+    response = await page.request.post(
+        f"{API_URL}/tasks",
+        headers=headers,
+        data={"repository_id": repo["id"], "user_input": user_input},
+    )
+    assert response.ok, f"Creating task {user_input!r} failed with HTTP {response.status}"
+    task = await response.json()
+
+    if status:
+        response = await page.request.patch(
+            f"{API_URL}/tasks/{task['id']}", headers=headers, data={"status": status}
+        )
+        assert response.ok, f"Moving task {user_input!r} to {status} failed with HTTP {response.status}"
+        task = await response.json()
+
+    return task
+
+
+async def open_board(page: Page, repo: dict) -> None:
+    """Pick repo on /repos and wait until its board is ready.
+
+    The selected repository only lives in memory, so a fresh page that
+    deep-links into the main layout is redirected to /repos anyway.
+    """
+    # Always reload the picker, so a repo registered after it was first loaded shows up
+    await page.goto(f"{BASE_URL}/repos", wait_until="domcontentloaded", timeout=10000)
+    await page.get_by_role("button").filter(has_text=repo["name"]).first.click()
+    await page.wait_for_url(f"{BASE_URL}/board**")
+    await page.wait_for_function("() => window.__APP_READY__ === true", timeout=10000)
+
+
+async def navigate(page: Page, path: str) -> None:
+    """Client-side navigation to path, keeping in-memory state such as the selected repo.
+
+    Clears window.__APP_READY__ before navigating and waits for the layout to
+    raise it again, i.e. for the new route to mount and its queries to settle.
+    """
+    await page.evaluate(
+        """(path) => {
+            window.__APP_READY__ = false
+            history.pushState({}, '', path)
+            dispatchEvent(new PopStateEvent('popstate'))
+        }""",
+        path,
+    )
+    await page.wait_for_function("() => window.__APP_READY__ === true", timeout=10000)
+
+
+async def setup_page(context: BrowserContext, initial_url: str) -> Page:
+    """Open a page on the context with the shared timeout and asset blocking, then load initial_url.
+
+    The dashboard renders no iframes, so there are no frames to wait on past
+    DOMContentLoaded; readiness is signalled by window.__APP_READY__ instead.
+    """
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    await context.route("**/*", block_static_assets)
+
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to the target URL and wait for DOMContentLoaded
+    await page.goto(initial_url, wait_until="domcontentloaded", timeout=10000)
+
+    return page
+
+
+async def run_standalone(run_test) -> None:
+    """Run one TC's run_test(browser) outside pytest, on its own headless Chromium."""
+    pw = None
+    browser = None
+
+    try:
+        # Start a Playwright session in asynchronous mode
+        pw = await async_playwright().start()
+
+        # Launch a Chromium browser in headless mode with custom arguments
+        browser = await pw.chromium.launch(
+            headless=True,
+            args=list(CHROMIUM_ARGS),
+        )
+
+        await run_test(browser)
+
+    finally:
+        if browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
+
+
+async def click(loc):
+    """Click the element once it is visible, instead of sleeping a fixed 3s first."""
+    await loc.wait_for(state="visible")
+    await loc.click()
+
+
+async def fill(loc, value):
+    """Fill the input once it is visible, instead of sleeping a fixed 3s first."""
+    await loc.wait_for(state="visible")
+    await loc.fill(value)
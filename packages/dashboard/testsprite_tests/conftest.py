@@ -0,0 +1,22 @@
+import pytest_asyncio
+from playwright import async_api
+from _harness import CHROMIUM_ARGS
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def pw():
+    """One Playwright driver process shared by every TC in the suite."""
+    playwright = await async_api.async_playwright().start()
+    yield playwright
+    await playwright.stop()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser(pw):
+    """One Chromium process for the whole suite; tests isolate through contexts."""
+    browser = await pw.chromium.launch(
+        headless=True,
+        args=list(CHROMIUM_ARGS),
+    )
+    yield browser
+    await browser.close()
@@ -0,0 +1,32 @@
+import asyncio
+from playwright import async_api
+from _harness import CHROMIUM_ARGS
+from TC024_Diff_Viewer_large_diffs_performance_and_virtualization import run_test as run_tc024
+from TC025_Feedback_System_feedback_history_pagination_and_visibility import run_test as run_tc025
+
+
+async def main():
+    pw = None
+    browser = None
+
+    try:
+        # Start a Playwright session in asynchronous mode
+        pw = await async_api.async_playwright().start()
+
+        # One Chromium for both flows; each test opens its own isolated context
+        browser = await pw.chromium.launch(
+            headless=True,
+            args=list(CHROMIUM_ARGS),
+        )
+
+        # The two flows are independent, so run them side by side
+        await asyncio.gather(run_tc024(browser), run_tc025(browser))
+
+    finally:
+        if browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+import asyncio
+from playwright import async_api
+from _harness import BASE_URL, CHROMIUM_ARGS, STATE_PATH
+
+
+async def save_storage_state():
+    """Capture cookies + localStorage after the dashboard has bootstrapped once.
+
+    Test contexts load the file so they skip the cold SPA start-up work. It
+    holds neither the auth token, which the dashboard keeps in sessionStorage,
+    nor the selected repository, which only lives in memory; tests still pick
+    a repo through open_board.
+    """
+    pw = None
+    browser = None
+    context = None
+
+    try:
+        pw = await async_api.async_playwright().start()
+        browser = await pw.chromium.launch(headless=True, args=list(CHROMIUM_ARGS))
+        context = await browser.new_context()
+        page = await context.new_page()
+
+        # Load the dashboard and let it settle so persisted stores are written
+        await page.goto(f"{BASE_URL}/repos", wait_until="networkidle", timeout=30000)
+
+        await context.storage_state(path=str(STATE_PATH))
+        print(f"Saved storage state to {STATE_PATH}")
+
+    finally:
+        if context:
+            await context.close()
+        if browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
+
+if __name__ == "__main__":
+    asyncio.run(save_storage_state())